@@ -0,0 +1,112 @@
+"""
+Shared module for copying note files.
+"""
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Below this size a plain buffered copy costs no more than a kernel copy
+_KERNEL_COPY_MIN_SIZE = 64 * 1024
+
+
+def _copy_range(src_fd, dst_fd, size, same_device):
+    """
+    Copy size bytes between file descriptors inside the kernel.
+    
+    Args:
+        src_fd: Source file descriptor, opened for reading
+        dst_fd: Destination file descriptor, opened for writing
+        size: Number of bytes to copy
+        same_device: True if both files live on the same filesystem
+    
+    Returns:
+        int: Number of bytes copied
+    """
+    offset = 0
+    while offset < size:
+        if same_device and hasattr(os, "copy_file_range"):
+            sent = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+        else:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def copy_file(src, dst):
+    """
+    Copy a file's data and timestamps from src to dst.
+    
+    On Linux, files of at least _KERNEL_COPY_MIN_SIZE bytes are copied with
+    copy_file_range/sendfile; smaller files and other platforms go through
+    shutil.copyfile (which uses fcopyfile on macOS). Timestamps are set with
+    a single utime call; permission bits are not copied.
+    
+    Args:
+        src: Path to the source file
+        dst: Path to the destination file
+    
+    Returns:
+        The destination path (so it can be used as a copytree copy_function)
+    """
+    src_stat = os.stat(src)
+    if src_stat.st_size < _KERNEL_COPY_MIN_SIZE or not sys.platform.startswith("linux"):
+        shutil.copyfile(src, dst)
+    else:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            same_device = os.fstat(fdst.fileno()).st_dev == src_stat.st_dev
+            try:
+                copied = _copy_range(fsrc.fileno(), fdst.fileno(), src_stat.st_size, same_device)
+            except OSError:
+                # Unsupported by this filesystem, redo it with a buffered copy
+                copied = 0
+            if copied < src_stat.st_size:
+                fsrc.seek(copied)
+                fdst.seek(copied)
+                shutil.copyfileobj(fsrc, fdst)
+    
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return dst
+
+
+def copy_files(pairs):
+    """
+    Copy (src, dst) file pairs with copy_file, overlapping their I/O in a
+    thread pool when there are more than two of them.
+    
+    Args:
+        pairs: Iterable of (source path, destination path) tuples
+    """
+    pairs = list(pairs)
+    if len(pairs) <= 2:
+        # Not worth the thread pool startup
+        for src, dst in pairs:
+            copy_file(src, dst)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+        # Consuming the results re-raises the first copy error
+        list(executor.map(lambda pair: copy_file(*pair), pairs))
+
+
+def copy_tree(src, dst):
+    """
+    Copy a directory tree to dst (which must not exist), copying its files with copy_files.
+    
+    Args:
+        src: Path to the source directory
+        dst: Path to the destination directory
+        
+    Returns:
+        The destination path
+    """
+    pairs = []
+    for root, dirs, files in os.walk(src):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_root)
+        pairs.extend((os.path.join(root, name), os.path.join(target_root, name)) for name in files)
+    
+    copy_files(pairs)
+    return dst
@@ -4,18 +4,38 @@ Shared module for filtering files of interest in noting_area.
 import os
 from pathlib import Path
 
+# Lowercased names of the items note operations care about
+_INTEREST = frozenset({"readme.md", "assets"})
+
 
 def is_file_of_interest(item):
     """
     Check if a file or folder is of interest for note operations.
     
     Args:
-        item: A Path object representing a file or folder
+        item: A Path or os.DirEntry object representing a file or folder
         
     Returns:
         bool: True if the item is README.md or assets folder (case-insensitive)
     """
-    return item.name.lower() == "readme.md" or item.name.lower() == "assets"
+    return item.name.lower() in _INTEREST
+
+
+def get_entries_of_interest(folder_path):
+    """
+    Get directory entries of interest from a given folder.
+    
+    The scandir iterator is closed before returning; the entries keep their
+    cached file type, so is_file()/is_dir() need no further stat calls.
+    
+    Args:
+        folder_path: A Path object representing the folder to scan
+        
+    Returns:
+        list: List of os.DirEntry objects for items of interest (README.md and assets folder)
+    """
+    with os.scandir(folder_path) as entries:
+        return [entry for entry in entries if entry.name.lower() in _INTEREST]
 
 
 def get_files_of_interest(folder_path):
@@ -28,10 +48,7 @@ def get_files_of_interest(folder_path):
     Returns:
         list: List of Path objects for items of interest (README.md and assets folder)
     """
-    return [
-        item for item in folder_path.iterdir() 
-        if is_file_of_interest(item)
-    ]
+    return [Path(entry.path) for entry in get_entries_of_interest(folder_path)]
 
 
 def get_next_serial_number(base_folder, date_str):
@@ -45,27 +62,24 @@ def get_next_serial_number(base_folder, date_str):
     Returns:
         int: Next available serial number (starts from 1)
     """
-    if not os.path.exists(base_folder):
-        return 1
-    
-    existing_folders = [f for f in os.listdir(base_folder) 
-                       if os.path.isdir(os.path.join(base_folder, f)) 
-                       and f.startswith(date_str)]
-    
-    if not existing_folders:
+    # Format: DATE_XXX where XXX is the serial number
+    prefix = date_str + "_"
+    best = 0
+    try:
+        entries = os.scandir(base_folder)
+    except FileNotFoundError:
         return 1
     
-    # Extract serial numbers from existing folders
-    serials = []
-    for folder in existing_folders:
-        try:
-            # Format: DATE_XXX where XXX is the serial number
-            serial = int(folder.split('_')[1])
-            serials.append(serial)
-        except (IndexError, ValueError):
-            continue
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(prefix) or not entry.is_dir():
+                continue
+            tail = name[len(prefix):]
+            if tail.isdecimal():
+                best = max(best, int(tail))
     
-    return max(serials) + 1 if serials else 1
+    return best + 1
 
 
 def get_latest_folder_by_date(base_folder):
@@ -82,8 +96,10 @@ def get_latest_folder_by_date(base_folder):
         return None
     
     # Get all folders that look like dates (8 digits)
-    date_folders = [f for f in base_folder.iterdir() 
-                   if f.is_dir() and f.name.isdigit() and len(f.name) == 8]
+    with os.scandir(base_folder) as entries:
+        date_folders = [entry.name for entry in entries
+                        if entry.is_dir(follow_symlinks=False)
+                        and entry.name.isdigit() and len(entry.name) == 8]
     
     if not date_folders:
         return None
@@ -91,5 +107,5 @@ def get_latest_folder_by_date(base_folder):
     # Sort by name (YYYYMMDD format sorts correctly)
     date_folders.sort(reverse=True)
     
-    return date_folders[0]
+    return base_folder / date_folders[0]
 
@@ -3,6 +3,76 @@ Shared module for extracting information from notes.
 """
 import re
 
+# Patterns shared by the note parsers, compiled once at import
+_IMG_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_HEADER_RE = re.compile(r'###\s+(.+)')
+_ASSET_RE = re.compile(r'!\[.*?\]\(\./assets/([^)]+)\)')
+
+# French names indexed by date.weekday() and by month number (1-12)
+_FRENCH_DAYS = ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche")
+_FRENCH_MONTHS = (
+    None, "Janvier", "Fevrier", "Mars", "Avril", "Mai", "Juin",
+    "Juillet", "Aout", "Septembre", "Octobre", "Novembre", "Decembre"
+)
+
+
+def _extract_header_line(content):
+    """
+    Find the first ### line after the first image link (PICTURE OF THE DAY).
+    
+    Args:
+        content: Text of the note README.md file
+        
+    Returns:
+        str: The stripped header line, or None if not found
+    """
+    img_match = _IMG_RE.search(content)
+    if not img_match:
+        return None
+    
+    header_match = _HEADER_RE.search(content, img_match.end())
+    if not header_match:
+        return None
+    
+    return header_match.group(1).strip()
+
+
+def _parse_weather(header_line):
+    """Split the header line (Date, Temperature, Weather, Location) into (temperature, weather)."""
+    if header_line:
+        parts = [p.strip() for p in header_line.split(',')]
+        if len(parts) >= 3:
+            return parts[1], parts[2]
+    return "Inconnu", "Inconnu"
+
+
+def _truncate_info(info_line, max_length):
+    """Truncate the natural info line to max_length characters, appending "..." if needed."""
+    if info_line is None:
+        return "Information non disponible"
+    if len(info_line) > max_length:
+        # Truncate to leave room for "..."
+        truncated = info_line[:max_length - 3].strip()
+        return f"{truncated}..."
+    return info_line
+
+
+def extract_header_fields(content, max_length=45):
+    """
+    Extract temperature, weather and natural info from already-read note content
+    in a single pass over the header line.
+    
+    Args:
+        content: Text of the note README.md file
+        max_length: Maximum length of the natural info string (default 45)
+        
+    Returns:
+        tuple: (temperature, weather, natural_info) as strings
+    """
+    header_line = _extract_header_line(content)
+    temperature, weather = _parse_weather(header_line)
+    return temperature, weather, _truncate_info(header_line, max_length)
+
 
 def extract_weather_from_note(note_file):
     """
@@ -17,27 +87,7 @@ def extract_weather_from_note(note_file):
     try:
         with open(note_file, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        # Find first image link
-        img_pattern = r'!\[.*?\]\(.*?\)'
-        img_match = re.search(img_pattern, content)
-        
-        if img_match:
-            # Find the ### line after the image
-            after_img = content[img_match.end():]
-            header_pattern = r'###\s+(.+)'
-            header_match = re.search(header_pattern, after_img)
-            
-            if header_match:
-                header_line = header_match.group(1).strip()
-                # Parse: Date, Temperature, Weather, Location
-                parts = [p.strip() for p in header_line.split(',')]
-                if len(parts) >= 3:
-                    temperature = parts[1]  # Temperature is the second part
-                    weather = parts[2]      # Weather is the third part
-                    return temperature, weather
-        
-        return "Inconnu", "Inconnu"
+        return _parse_weather(_extract_header_line(content))
     except Exception as e:
         print(f"Warning: Could not extract weather/temperature: {e}")
         return "Inconnu", "Inconnu"
@@ -58,29 +108,7 @@ def extract_natural_info(note_file, max_length=45):
     try:
         with open(note_file, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        # Find first image link (PICTURE OF THE DAY)
-        img_pattern = r'!\[.*?\]\(.*?\)'
-        img_match = re.search(img_pattern, content)
-        
-        if img_match:
-            # Find the ### line after the image
-            after_img = content[img_match.end():]
-            header_pattern = r'###\s+(.+)'
-            header_match = re.search(header_pattern, after_img)
-            
-            if header_match:
-                info_line = header_match.group(1).strip()
-                
-                # Truncate if exceeds max_length
-                if len(info_line) > max_length:
-                    # Truncate to leave room for "..."
-                    truncated = info_line[:max_length - 3].strip()
-                    return f"{truncated}..."
-                
-                return info_line
-        
-        return "Information non disponible"
+        return _truncate_info(_extract_header_line(content), max_length)
     except Exception as e:
         print(f"Warning: Could not extract natural info: {e}")
         return "Information non disponible"
@@ -102,8 +130,7 @@ def get_referenced_assets(readme_file):
         
         # Find all image and video references
         # Pattern for ![...](./assets/filename) and [![...](./assets/filename)]
-        asset_pattern = r'!\[.*?\]\(./assets/([^)]+)\)'
-        matches = re.findall(asset_pattern, content)
+        matches = _ASSET_RE.findall(content)
         
         return set(matches)
     except Exception as e:
@@ -121,16 +148,7 @@ def get_french_weekday(date):
     Returns:
         str: French weekday name
     """
-    french_days = {
-        0: "Lundi",
-        1: "Mardi",
-        2: "Mercredi",
-        3: "Jeudi",
-        4: "Vendredi",
-        5: "Samedi",
-        6: "Dimanche"
-    }
-    return french_days[date.weekday()]
+    return _FRENCH_DAYS[date.weekday()]
 
 
 def get_french_date(date):
@@ -143,12 +161,7 @@ def get_french_date(date):
     Returns:
         str: French formatted date without year
     """
-    french_months = {
-        1: "Janvier", 2: "Fevrier", 3: "Mars", 4: "Avril",
-        5: "Mai", 6: "Juin", 7: "Juillet", 8: "Aout",
-        9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Decembre"
-    }
-    return f"{date.day} {french_months[date.month]}"
+    return f"{date.day} {_FRENCH_MONTHS[date.month]}"
 
 
 def get_french_month(month_num):
@@ -161,9 +174,4 @@ def get_french_month(month_num):
     Returns:
         str: French month name
     """
-    french_months = {
-        1: "Janvier", 2: "Fevrier", 3: "Mars", 4: "Avril",
-        5: "Mai", 6: "Juin", 7: "Juillet", 8: "Aout",
-        9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Decembre"
-    }
-    return french_months[month_num]
+    return _FRENCH_MONTHS[month_num]
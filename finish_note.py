@@ -1,35 +1,87 @@
+import os
+import mmap
 import shutil
-import filecmp
-import sys
+import hashlib
+import importlib.util
 from datetime import datetime
 from pathlib import Path
 
-# Add back_office/py to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "back_office" / "py"))
-from file_filters import get_files_of_interest, get_next_serial_number
-from info_extraction import (
-    extract_weather_from_note,
-    extract_natural_info,
-    get_referenced_assets,
-    get_french_weekday,
-    get_french_month
-)
+# Folder containing the note scripts
+_BASE_DIR = Path(__file__).resolve().parent
 
 
-def has_changes(noting_area, template_folder):
+def _load_back_office_module(name):
+    """Load back_office/py/<name>.py as a module, without adding the folder to sys.path."""
+    spec = importlib.util.spec_from_file_location(name, _BASE_DIR / "back_office" / "py" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Shared back_office/py helpers
+_file_filters = _load_back_office_module("file_filters")
+get_entries_of_interest = _file_filters.get_entries_of_interest
+get_next_serial_number = _file_filters.get_next_serial_number
+
+_file_copy = _load_back_office_module("file_copy")
+copy_file = _file_copy.copy_file
+copy_files = _file_copy.copy_files
+copy_tree = _file_copy.copy_tree
+
+_info_extraction = _load_back_office_module("info_extraction")
+extract_header_fields = _info_extraction.extract_header_fields
+get_referenced_assets = _info_extraction.get_referenced_assets
+get_french_weekday = _info_extraction.get_french_weekday
+get_french_month = _info_extraction.get_french_month
+
+# Digests of template files, keyed by (path, mtime_ns, size)
+_template_digests = {}
+
+
+def file_digest(file_path):
+    """Stream-hash a file in 64KiB blocks and return its digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(65536)
+            if not block:
+                break
+            digest.update(block)
+    return digest.digest()
+
+
+def template_digest(template_file, stat):
+    """Return the digest of a template file, reusing it while the file is unchanged."""
+    key = (os.fspath(template_file), stat.st_mtime_ns, stat.st_size)
+    if key not in _template_digests:
+        _template_digests[key] = file_digest(template_file)
+    return _template_digests[key]
+
+
+def files_differ(noting_file, template_file):
+    """Compare two files by size first, then by content digest."""
+    noting_stat = noting_file.stat()
+    template_stat = template_file.stat()
+    if noting_stat.st_size != template_stat.st_size:
+        return True
+    return file_digest(noting_file) != template_digest(template_file, template_stat)
+
+
+def has_changes(noting_area, template_folder, noting_entries=None):
     """Check if noting_area has any changes compared to template."""
-    # Only check files of interest
-    noting_files = {item.name for item in get_files_of_interest(noting_area)}
-    template_files = {item.name for item in get_files_of_interest(template_folder)}
+    # Only check files of interest, scanning each folder once
+    if noting_entries is None:
+        noting_entries = get_entries_of_interest(noting_area)
+    noting_files = {entry.name: entry for entry in noting_entries}
+    template_files = {entry.name: entry for entry in get_entries_of_interest(template_folder)}
     
     # If file lists differ, there are changes
-    if noting_files != template_files:
+    if noting_files.keys() != template_files.keys():
         return True
     
     # Compare file contents for files of interest
-    for item in get_files_of_interest(noting_area):
-        noting_file = noting_area / item.name
-        template_file = template_folder / item.name
+    for name, noting_file in noting_files.items():
+        template_file = template_files[name]
         
         # Skip if not both files
         if not (noting_file.is_file() and template_file.is_file()):
@@ -38,44 +90,63 @@ def has_changes(noting_area, template_folder):
             continue
         
         # Compare files
-        if not filecmp.cmp(noting_file, template_file, shallow=False):
+        if files_differ(noting_file, template_file):
             return True
     
     return False
 
 
-def copy_with_asset_filter(noting_area, dest_folder):
+def has_entries(folder_path):
+    """Check if a folder has at least one entry without listing all of it."""
+    with os.scandir(folder_path) as entries:
+        return next(entries, None) is not None
+
+
+def copy_with_asset_filter(noting_area, dest_folder, noting_entries=None):
     """Copy contents from noting_area to dest_folder, filtering unreferenced assets and only copying files of interest."""
-    readme_file = noting_area / "README.md"
-    referenced_assets = get_referenced_assets(readme_file) if readme_file.exists() else set()
+    if noting_entries is None:
+        noting_entries = get_entries_of_interest(noting_area)
+    
+    # Only read README.md for asset references when there are assets to filter
+    referenced_assets = set()
+    if any(entry.name.lower() == "assets" and entry.is_dir() and has_entries(entry) for entry in noting_entries):
+        readme_file = noting_area / "README.md"
+        if readme_file.exists():
+            referenced_assets = get_referenced_assets(readme_file)
     
     copied_count = 0
     skipped_count = 0
     
     # Only copy files of interest (README.md and assets folder)
-    for item in get_files_of_interest(noting_area):
-        dest = dest_folder / item.name
+    for entry in noting_entries:
+        dest = dest_folder / entry.name
         
-        if item.name.lower() == "assets" and item.is_dir():
+        if entry.name.lower() == "assets" and entry.is_dir():
             # Handle assets folder with filtering
             dest.mkdir(exist_ok=True)
-            for asset_file in item.iterdir():
-                if asset_file.name in referenced_assets:
-                    shutil.copy2(asset_file, dest / asset_file.name)
-                    print(f"  Copied asset: {asset_file.name}")
-                    copied_count += 1
-                else:
-                    print(f"  Skipped unreferenced asset: {asset_file.name}")
-                    skipped_count += 1
-        elif item.is_file():
-            shutil.copy2(item, dest)
-            print(f"  Copied: {item.name}")
+            asset_pairs = []
+            msgs = []
+            with os.scandir(entry.path) as assets:
+                for asset in assets:
+                    if asset.name in referenced_assets:
+                        asset_pairs.append((asset.path, dest / asset.name))
+                        msgs.append(f"  Copied asset: {asset.name}")
+                        copied_count += 1
+                    else:
+                        msgs.append(f"  Skipped unreferenced asset: {asset.name}")
+                        skipped_count += 1
+            copy_files(asset_pairs)
+            if msgs:
+                print('\n'.join(msgs))
+        elif entry.is_file():
+            copy_file(entry.path, dest)
+            print(f"  Copied: {entry.name}")
             copied_count += 1
-        elif item.is_dir():
+        elif entry.is_dir():
             if dest.exists():
                 shutil.rmtree(dest)
-            shutil.copytree(item, dest)
-            print(f"  Copied directory: {item.name}")
+            copy_tree(entry.path, dest)
+            print(f"  Copied directory: {entry.name}")
             copied_count += 1
     
     if skipped_count > 0:
@@ -154,13 +225,67 @@ def update_root_readme_with_year(root_readme_path, year):
     print(f"Added 'Book Of {year}' link to root README")
 
 
+def find_year_readme_insert(data, month_name, new_entry):
+    """
+    Locate where a new note entry goes in the year README.
+    
+    Args:
+        data: Year README contents as bytes or a read-only mmap
+        month_name: French name of the entry's month
+        new_entry: The note link line to insert
+        
+    Returns:
+        tuple: (insert_pos, insert_bytes) byte offset and the bytes to insert there
+    """
+    # Keep the file's own line endings
+    nl = b'\r\n' if data.find(b'\r\n') != -1 else b'\n'
+    month_header = f"## {month_name}".encode('utf-8')
+    entry = new_entry.encode('utf-8')
+    
+    # Find the month header
+    month_pos = data.find(month_header)
+    if month_pos != -1:
+        # Find the next line after the header
+        header_end = data.find(b'\n', month_pos)
+        header_end = len(data) if header_end == -1 else header_end + 1
+        
+        # Find where this month section ends (next ## or <br/> line)
+        section_end = len(data)
+        for marker in (b'\n##', b'\n<br/>'):
+            marker_pos = data.find(marker, header_end - 1)
+            if marker_pos != -1:
+                section_end = min(section_end, marker_pos)
+        
+        # Find the last line starting with '[_' in this section
+        note_pos = data.rfind(b'[_', header_end, section_end)
+        while note_pos != -1 and data[data.rfind(b'\n', 0, note_pos) + 1:note_pos].strip():
+            note_pos = data.rfind(b'[_', header_end, note_pos)
+        
+        if note_pos != -1:
+            # Add line break before new entry, after the last note entry
+            line_end = data.find(b'\n', note_pos)
+            return (len(data) if line_end == -1 else line_end + 1), nl + entry + nl
+        
+        # No existing notes, insert right after month header with blank line
+        return header_end, nl + entry + nl
+    
+    # Month doesn't exist, need to add it before <br/>
+    br_pos = data.find(b'\n<br/>')
+    if br_pos != -1:
+        return br_pos + 1, month_header + nl + nl + entry + nl + nl
+    
+    # Fallback: add at the end before disclaimer
+    disclaimer_pos = data.find(b'### Images Copyrights Disclaimer')
+    if disclaimer_pos != -1:
+        line_start = data.rfind(b'\n', 0, disclaimer_pos) + 1
+        return line_start, month_header + nl + nl + entry + nl + nl + b'<br/>' + nl + nl
+    
+    return len(data), nl + month_header + nl + nl + entry + nl
+
+
 def update_year_readme(readme_path, new_note_link, date, temperature, weather):
     """Update the year's README.md with the new note link."""
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     month_name = get_french_month(date.month)
-    month_header = f"## {month_name}"
     
     # Get French weekday
     weekday = get_french_weekday(date)
@@ -168,71 +293,41 @@ def update_year_readme(readme_path, new_note_link, date, temperature, weather):
     # Create the new link entry (with temperature and weather)
     new_entry = f"[_{date.day}, {weekday}, {temperature}, {weather}_]({new_note_link})"
     
-    # Find the month header
-    if month_header in content:
-        # Find the position after the month header
-        month_pos = content.find(month_header)
-        # Find the next line after the header
-        next_line_pos = content.find('\n', month_pos) + 1
-        
-        # Find the last note entry for this month (before next ## or <br/>)
-        # Look for the last line starting with '[_' after the month header
-        search_start = next_line_pos
-        # Find where this month section ends (next ## or <br/>)
-        next_section = len(content)
-        next_month_pos = content.find('\n##', search_start)
-        next_br_pos = content.find('\n<br/>', search_start)
-        
-        if next_month_pos != -1:
-            next_section = min(next_section, next_month_pos)
-        if next_br_pos != -1:
-            next_section = min(next_section, next_br_pos)
-        
-        month_section = content[search_start:next_section]
-        
-        # Find all note entries in this section
-        note_lines = [line for line in month_section.split('\n') if line.strip().startswith('[_')]
-        
-        if note_lines:
-            # Find position after the last note entry
-            last_note = note_lines[-1]
-            last_note_pos = content.find(last_note, search_start)
-            insert_pos = content.find('\n', last_note_pos) + 1
-            # Add line break before new entry
-            content = content[:insert_pos] + '\n' + new_entry + '\n' + content[insert_pos:]
+    # Search the README bytes through a read-only memory map and copy them
+    # out only once, into a new file that replaces the README
+    tmp_path = f"{readme_path}.tmp"
+    with open(readme_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = b''
         else:
-            # No existing notes, insert right after month header with blank line
-            content = content[:next_line_pos] + '\n' + new_entry + '\n' + content[next_line_pos:]
-    else:
-        # Month doesn't exist, need to add it before <br/>
-        br_pos = content.find('\n<br/>')
-        if br_pos != -1:
-            content = content[:br_pos] + f"\n## {month_name}\n\n{new_entry}\n" + content[br_pos:]
-        else:
-            # Fallback: add at the end before disclaimer
-            disclaimer_pos = content.find('### Images Copyrights Disclaimer')
-            if disclaimer_pos != -1:
-                content = content[:disclaimer_pos] + f"## {month_name}\n\n{new_entry}\n\n<br/>\n\n" + content[disclaimer_pos:]
-            else:
-                content += f"\n## {month_name}\n\n{new_entry}\n"
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            insert_pos, insert_bytes = find_year_readme_insert(data, month_name, new_entry)
+            with open(tmp_path, 'wb') as out, memoryview(data) as view:
+                out.write(view[:insert_pos])
+                out.write(insert_bytes)
+                out.write(view[insert_pos:])
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
     
     # Write back
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    os.replace(tmp_path, readme_path)
 
 
 def finish_note():
     """
     Main function to finish and archive the note.
     """
-    base_dir = Path(__file__).parent
+    base_dir = _BASE_DIR
     noting_area = base_dir / "noting_area"
     template_folder = base_dir / "back_office" / "template"
     notes_base = base_dir / "notes"
     backup_base = base_dir / "back_office" / "notes_backup" / "year_notes"
     
     # Check if noting_area has changes
-    if not has_changes(noting_area, template_folder):
+    noting_entries = get_entries_of_interest(noting_area)
+    if not has_changes(noting_area, template_folder, noting_entries):
         print("No changes detected in noting_area compared to template. Nothing to finish.")
         return
     
@@ -240,9 +335,8 @@ def finish_note():
     
     # Get current date
     now = datetime.now()
-    year_str = now.strftime("%Y")
-    month_str = now.strftime("%m")
-    date_str = now.strftime("%Y%m%d")
+    year_str, month_str = f"{now.year:04d}", f"{now.month:02d}"
+    date_str = f"{year_str}{month_str}{now.day:02d}"
     
     # Create folder structure: notes/YEAR/MONTH/DATE
     year_folder = notes_base / year_str
@@ -253,22 +347,32 @@ def finish_note():
     print(f"Created note folder: {date_folder.relative_to(base_dir)}")
     
     # Copy contents from noting_area to new folder (with asset filtering)
-    copy_with_asset_filter(noting_area, date_folder)
+    copy_with_asset_filter(noting_area, date_folder, noting_entries)
     
     # Extract weather, temperature, and natural info from the note
     note_readme = date_folder / "README.md"
-    temperature, weather = extract_weather_from_note(note_readme) if note_readme.exists() else ("Inconnu", "Inconnu")
-    natural_info = extract_natural_info(note_readme, max_length=40) if note_readme.exists() else "Information non disponible"
+    if note_readme.exists():
+        # Read once and parse the header line for all fields
+        try:
+            note_content = note_readme.read_text(encoding='utf-8')
+            temperature, weather, natural_info = extract_header_fields(note_content, max_length=40)
+        except Exception as e:
+            print(f"Warning: Could not extract weather/temperature and natural info: {e}")
+            temperature, weather, natural_info = "Inconnu", "Inconnu", "Information non disponible"
+    else:
+        temperature, weather, natural_info = "Inconnu", "Inconnu", "Information non disponible"
     
     print(f"Extracted temperature: {temperature}, weather: {weather}")
     print(f"Natural info: {natural_info}")
     
     # Clear noting_area
-    for item in noting_area.iterdir():
-        if item.is_file():
-            item.unlink()
-        elif item.is_dir():
-            shutil.rmtree(item)
+    with os.scandir(noting_area) as entries:
+        noting_area_entries = list(entries)
+    for entry in noting_area_entries:
+        if entry.is_file():
+            os.unlink(entry.path)
+        elif entry.is_dir():
+            shutil.rmtree(entry.path)
     print("Cleared noting_area")
     
     # Check if year README exists before creating backup
@@ -1,12 +1,34 @@
+import os
 import shutil
 import re
-import sys
+import importlib.util
 from datetime import datetime
 from pathlib import Path
 
-# Add back_office/py to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "back_office" / "py"))
-from file_filters import get_files_of_interest, get_next_serial_number, get_latest_folder_by_date
+# Folder containing the note scripts
+_BASE_DIR = Path(__file__).resolve().parent
+
+
+def _load_back_office_module(name):
+    """Load back_office/py/<name>.py as a module, without adding the folder to sys.path."""
+    spec = importlib.util.spec_from_file_location(name, _BASE_DIR / "back_office" / "py" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Shared back_office/py helpers
+_file_filters = _load_back_office_module("file_filters")
+get_entries_of_interest = _file_filters.get_entries_of_interest
+get_next_serial_number = _file_filters.get_next_serial_number
+get_latest_folder_by_date = _file_filters.get_latest_folder_by_date
+
+_file_copy = _load_back_office_module("file_copy")
+copy_file = _file_copy.copy_file
+copy_tree = _file_copy.copy_tree
+
+# Year README month header lines
+_MONTH_HEADER_RE = re.compile(r'## \w+')
 
 
 def get_latest_note_folder(notes_base, year_str, month_str):
@@ -20,7 +42,8 @@ def get_latest_backup_folder(backup_base):
     if not backup_base.exists():
         return None
     
-    backup_folders = [f for f in backup_base.iterdir() if f.is_dir()]
+    with os.scandir(backup_base) as entries:
+        backup_folders = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
     
     if not backup_folders:
         return None
@@ -28,7 +51,32 @@ def get_latest_backup_folder(backup_base):
     # Sort by name (YYYYMMDD_XXX format)
     backup_folders.sort(reverse=True)
     
-    return backup_folders[0]
+    return backup_base / backup_folders[0]
+
+
+def drop_empty_month_sections(lines):
+    """Return the year README lines without month sections that have no note entries."""
+    kept = []
+    section = None
+    for line in lines:
+        is_header = _MONTH_HEADER_RE.match(line) is not None
+        
+        # A month section runs from its header to the next header or <br/> line
+        if section is not None and (is_header or line.startswith('<br/>')):
+            if any(l.lstrip().startswith('[_') for l in section):
+                kept.extend(section)
+            section = None
+        
+        if is_header:
+            section = [line]
+        elif section is not None:
+            section.append(line)
+        else:
+            kept.append(line)
+    
+    if section is not None and any(l.lstrip().startswith('[_') for l in section):
+        kept.extend(section)
+    return kept
 
 
 def extract_note_link_from_readme(readme_path, date_folder_name):
@@ -36,94 +84,48 @@ def extract_note_link_from_readme(readme_path, date_folder_name):
     with open(readme_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # Find the link pattern for the date folder
-    link_pattern = rf'\[_.*?\]\(\./\d{{2}}/{date_folder_name}/\)'
-    
-    # Search for the link
-    match = re.search(link_pattern, content)
-    
-    if not match:
+    # The date folder name appears verbatim in its link, so without it there is nothing to remove
+    if date_folder_name not in content:
         return content, False
     
-    # Get the line containing the match
-    link_line = match.group(0)
-    
-    # Find the full line (including newline before and after)
-    start_pos = match.start()
-    
-    # Find the start of the line (look backwards for newline)
-    line_start = content.rfind('\n', 0, start_pos)
-    if line_start == -1:
-        line_start = 0
-    else:
-        line_start += 1  # Move past the newline
-    
-    # Find the end of the line (look forward for newline)
-    line_end = content.find('\n', match.end())
-    if line_end == -1:
-        line_end = len(content)
-    else:
-        line_end += 1  # Include the newline
-    
-    # Check if there's a blank line before this entry
-    check_pos = line_start - 1
-    if check_pos > 0 and content[check_pos] == '\n':
-        # Check if the line before the blank line is not a header
-        prev_line_start = content.rfind('\n', 0, check_pos - 1)
-        if prev_line_start != -1:
-            prev_line = content[prev_line_start + 1:check_pos].strip()
-            if not prev_line.startswith('##'):
-                line_start = check_pos  # Include the blank line in removal
+    # Find the note entry line linking to the date folder, e.g. "[_2, ...](./12/20251202/)"
+    lines = content.splitlines(keepends=True)
+    link_tail = f"/{date_folder_name}/)"
+    line_idx = next((i for i, line in enumerate(lines)
+                     if line.lstrip().startswith('[_') and link_tail in line), None)
     
-    # Remove the line
-    new_content = content[:line_start] + content[line_end:]
+    if line_idx is None:
+        return content, False
     
-    # Check if the month section is now empty and remove it
-    # Find month headers
-    month_pattern = r'## \w+'
-    month_matches = list(re.finditer(month_pattern, new_content))
+    # Include the blank line before this entry in removal, unless it follows a header
+    first_idx = line_idx
+    if line_idx >= 2 and lines[line_idx - 1].strip() == '' and not lines[line_idx - 2].strip().startswith('##'):
+        first_idx = line_idx - 1
     
-    for i, month_match in enumerate(month_matches):
-        month_start = month_match.start()
-        month_end = month_match.end()
-        
-        # Find the next section (next month or <br/>)
-        if i + 1 < len(month_matches):
-            next_section_start = month_matches[i + 1].start()
-        else:
-            next_section_start = new_content.find('\n<br/>', month_end)
-            if next_section_start == -1:
-                next_section_start = len(new_content)
-        
-        # Get the section content
-        section_content = new_content[month_end:next_section_start].strip()
-        
-        # If section has no note entries, remove the entire month section
-        if not any(line.strip().startswith('[_') for line in section_content.split('\n')):
-            # Remove from month header to start of next section (including blank lines)
-            new_content = new_content[:month_start] + new_content[next_section_start:]
-            break
+    # Remove the line, then any month section left without note entries,
+    # and rebuild the content with a single join
+    del lines[first_idx:line_idx + 1]
+    new_content = ''.join(drop_empty_month_sections(lines))
     
     return new_content, True
 
 
 def remove_empty_directories(path):
-    """Recursively remove empty directories."""
-    if not path.exists() or not path.is_dir():
-        return
-    
-    # First, try to remove empty subdirectories
-    for item in path.iterdir():
-        if item.is_dir():
-            remove_empty_directories(item)
-    
-    # Then try to remove this directory if it's empty
-    try:
-        if not any(path.iterdir()):
-            path.rmdir()
-            print(f"  Removed empty directory: {item.relative_to(Path(__file__).parent)}")
-    except:
-        pass
+    """Remove empty directories under path, including path itself, deepest first."""
+    # os.walk yields str roots under path, so a prefix strip gives the relative path
+    base_str = str(_BASE_DIR) + os.sep
+    msgs = []
+    for root, dirs, files in os.walk(path, topdown=False):
+        # rmdir refuses non-empty directories
+        try:
+            os.rmdir(root)
+        except OSError:
+            continue
+        msgs.append(f"  Removed empty directory: {root.removeprefix(base_str)}")
+    
+    # Report in one write rather than one per directory
+    if msgs:
+        print('\n'.join(msgs))
 
 
 def revert_note():
@@ -137,7 +139,7 @@ def revert_note():
     6. Delete the backup folder
     7. Clean up empty directories
     """
-    base_dir = Path(__file__).parent
+    base_dir = _BASE_DIR
     noting_area = base_dir / "noting_area"
     notes_base = base_dir / "notes"
     backup_base = base_dir / "back_office" / "notes_backup" / "year_notes"
@@ -145,15 +147,14 @@ def revert_note():
     
     # Get current date
     now = datetime.now()
-    year_str = now.strftime("%Y")
-    month_str = now.strftime("%m")
-    date_str = now.strftime("%Y%m%d")
+    year_str, month_str = f"{now.year:04d}", f"{now.month:02d}"
+    date_str = f"{year_str}{month_str}{now.day:02d}"
     
     # Step 1: Archive noting_area contents if anything there (only files of interest)
-    noting_area_contents = get_files_of_interest(noting_area)
+    noting_area_entries = get_entries_of_interest(noting_area)
     
-    if noting_area_contents:
-        print(f"Found {len(noting_area_contents)} item(s) in noting_area. Archiving to drafts...")
+    if noting_area_entries:
+        print(f"Found {len(noting_area_entries)} item(s) in noting_area. Archiving to drafts...")
         
         # Get serial number and create draft folder
         serial = get_next_serial_number(drafts_folder, date_str)
@@ -163,22 +164,15 @@ def revert_note():
         draft_folder_path.mkdir(parents=True, exist_ok=True)
         print(f"Created draft folder: {draft_folder_name}")
         
-        # Copy contents to draft folder (only files of interest)
-        for item in noting_area_contents:
-            dest = draft_folder_path / item.name
-            if item.is_file():
-                shutil.copy2(item, dest)
-                print(f"  Archived: {item.name}")
-            elif item.is_dir():
-                shutil.copytree(item, dest)
-                print(f"  Archived directory: {item.name}")
-        
-        # Clear noting_area (only files of interest)
-        for item in noting_area_contents:
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                shutil.rmtree(item)
+        # Move contents to draft folder (only files of interest), which also
+        # clears them from noting_area. Both live under base_dir, so this is
+        # normally a rename; shutil.move copies and deletes only across filesystems.
+        msgs = []
+        for entry in noting_area_entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            shutil.move(entry.path, draft_folder_path / entry.name, copy_function=copy_file)
+            msgs.append(f"  Archived directory: {entry.name}" if is_dir else f"  Archived: {entry.name}")
+        print('\n'.join(msgs))
         print("Cleared noting_area")
     
     # Step 2: Find the latest note folder
@@ -192,7 +186,9 @@ def revert_note():
     try:
         # Parse the date from the folder name (YYYYMMDD format)
         note_date_str = latest_note.name
-        note_date = datetime.strptime(note_date_str, "%Y%m%d")
+        if len(note_date_str) != 8 or not note_date_str.isdigit():
+            raise ValueError(f"not a YYYYMMDD date: {note_date_str}")
+        note_date = datetime(int(note_date_str[:4]), int(note_date_str[4:6]), int(note_date_str[6:8]))
         
         # Calculate time difference
         time_diff = now - note_date
@@ -208,16 +204,17 @@ def revert_note():
     print(f"Found latest note: {latest_note.relative_to(base_dir)}")
     
     # Step 3: Copy note contents back to noting_area (only files of interest)
-    for item in latest_note.iterdir():
-        # Only restore files of interest
-        if item.name.lower() == "readme.md" or item.name.lower() == "assets":
-            dest = noting_area / item.name
-            if item.is_file():
-                shutil.copy2(item, dest)
-                print(f"  Restored: {item.name}")
-            elif item.is_dir():
-                shutil.copytree(item, dest)
-                print(f"  Restored directory: {item.name}")
+    msgs = []
+    for entry in get_entries_of_interest(latest_note):
+        dest = noting_area / entry.name
+        if entry.is_file(follow_symlinks=False):
+            copy_file(entry.path, dest)
+            msgs.append(f"  Restored: {entry.name}")
+        elif entry.is_dir(follow_symlinks=False):
+            copy_tree(entry.path, dest)
+            msgs.append(f"  Restored directory: {entry.name}")
+    if msgs:
+        print('\n'.join(msgs))
     
     # Step 4: Restore the year README from backup
     latest_backup = get_latest_backup_folder(backup_base)
@@ -246,10 +243,8 @@ def revert_note():
     print(f"Deleted note folder: {latest_note.relative_to(base_dir)}")
     
     # Step 7: Clean up empty directories
+    # One bottom-up walk of the year folder covers the month folder too
     print("Cleaning up empty directories...")
-    month_folder = notes_base / year_str / month_str
-    remove_empty_directories(month_folder)
-    
     year_folder = notes_base / year_str
     remove_empty_directories(year_folder)
     
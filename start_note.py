@@ -1,37 +1,51 @@
+import os
 import shutil
-import sys
+import importlib.util
 from datetime import datetime
 from pathlib import Path
 
-# Add back_office/py to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "back_office" / "py"))
-from file_filters import get_files_of_interest, get_next_serial_number
+# Folder containing the note scripts
+_BASE_DIR = Path(__file__).resolve().parent
+
+
+def _load_back_office_module(name):
+    """Load back_office/py/<name>.py as a module, without adding the folder to sys.path."""
+    spec = importlib.util.spec_from_file_location(name, _BASE_DIR / "back_office" / "py" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Shared back_office/py helpers
+_file_filters = _load_back_office_module("file_filters")
+get_entries_of_interest = _file_filters.get_entries_of_interest
+get_next_serial_number = _file_filters.get_next_serial_number
 
 
 def start_note():
     """
     Check noting_area folder, if anything there:
     1. Create a new folder in drafts with DATE_XXX format
-    2. Copy contents from noting_area to the new folder
-    3. Clear noting_area
-    4. Copy template contents to noting_area
+    2. Move contents from noting_area to the new folder (clearing noting_area)
+    3. Copy template contents to noting_area
     """
     # Define paths
-    base_dir = Path(__file__).parent
+    base_dir = _BASE_DIR
     noting_area = base_dir / "noting_area"
     drafts_folder = base_dir / "back_office" / "drafts"
     template_folder = base_dir / "back_office" / "template"
     
     # Check if noting_area has any contents (only README.md and assets folder)
-    noting_area_contents = get_files_of_interest(noting_area)
+    noting_area_entries = get_entries_of_interest(noting_area)
     
-    if not noting_area_contents:
+    if not noting_area_entries:
         print("noting_area is empty. Nothing to archive.")
     else:
-        print(f"Found {len(noting_area_contents)} item(s) in noting_area. Archiving...")
+        print(f"Found {len(noting_area_entries)} item(s) in noting_area. Archiving...")
         
         # Get current date and serial number
-        date_str = datetime.now().strftime("%Y%m%d")
+        now = datetime.now()
+        date_str = f"{now.year:04d}{now.month:02d}{now.day:02d}"
         serial = get_next_serial_number(drafts_folder, date_str)
         new_folder_name = f"{date_str}_{serial:03d}"
         new_folder_path = drafts_folder / new_folder_name
@@ -40,32 +54,25 @@ def start_note():
         new_folder_path.mkdir(parents=True, exist_ok=True)
         print(f"Created folder: {new_folder_name}")
         
-        # Copy contents from noting_area to new folder
-        for item in noting_area_contents:
-            dest = new_folder_path / item.name
-            if item.is_file():
-                shutil.copy2(item, dest)
-                print(f"  Copied: {item.name}")
-            elif item.is_dir():
-                shutil.copytree(item, dest)
-                print(f"  Copied directory: {item.name}")
-        
-        # Clear noting_area
-        for item in noting_area_contents:
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                shutil.rmtree(item)
+        # Move contents from noting_area to new folder, which also clears noting_area.
+        # This is a rename on the same filesystem; otherwise data is copied
+        # without metadata (drafts need none) and the original deleted.
+        msgs = []
+        for entry in noting_area_entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            shutil.move(entry.path, new_folder_path / entry.name, copy_function=shutil.copy)
+            msgs.append(f"  Moved directory: {entry.name}" if is_dir else f"  Moved: {entry.name}")
+        print('\n'.join(msgs))
         print("Cleared noting_area\n")
     
     # Copy template contents to noting_area
-    template_contents = list(template_folder.iterdir())
-    for item in template_contents:
-        dest = noting_area / item.name
-        if item.is_file():
-            shutil.copy2(item, dest)
-        elif item.is_dir():
-            shutil.copytree(item, dest)
+    with os.scandir(template_folder) as template_entries:
+        for entry in template_entries:
+            dest = noting_area / entry.name
+            if entry.is_file(follow_symlinks=False):
+                shutil.copy2(entry.path, dest)
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.copytree(entry.path, dest)
     
     print("""
 ✅ Good to go! Start writing your note for today.